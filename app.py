@@ -19,33 +19,161 @@ Routes:
 - GET /reset: Clear session and start fresh
 
 Usage:
-    python app.py
+    python app.py                      # development server
+    gunicorn -w 4 -k gthread app:app   # production
 """
 
 from flask import Flask, render_template, request, redirect, url_for, flash, session
+from flask_caching import Cache
+from flask_compress import Compress
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event, inspect
+from sqlalchemy.engine import Engine
+from sqlalchemy.schema import CreateTable
 from datetime import datetime, timezone
 import os
+import sqlite3
 from typing import Dict, List, Any, Optional, Union
 
 # Import model creation functions and form
 from models.pet_owner_model import create_pet_owner_model
 from models.pet_model import create_pet_model
 from forms.pet_owner_form import PetOwnerForm
+from utils.serialization import ORJSONProvider, ORJSONSessionInterface
 
 # Initialize Flask application
 app = Flask(__name__)
 app.config["SECRET_KEY"] = "your-secret-key-here"
 app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///pets.db"
 app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
+    "insertmanyvalues_page_size": 1000,
+    "pool_size": 10,
+    "pool_pre_ping": True,
+    "connect_args": {"check_same_thread": False},
+}
+
+# Cache settings (set CACHE_TYPE=RedisCache to share the cache between workers)
+app.config["CACHE_TYPE"] = os.environ.get("CACHE_TYPE", "SimpleCache")
+app.config["CACHE_REDIS_URL"] = os.environ.get(
+    "CACHE_REDIS_URL", "redis://localhost:6379/0"
+)
+app.config["CACHE_DEFAULT_TIMEOUT"] = 60
+
+# Response compression (Brotli preferred, gzip fallback)
+app.config["COMPRESS_ALGORITHM"] = ["br", "gzip"]
+app.config["COMPRESS_LEVEL"] = 4
+app.config["COMPRESS_BR_LEVEL"] = 4
+app.config["COMPRESS_MIN_SIZE"] = 500
+
+# Use orjson for JSON responses and session cookie serialization
+app.json = ORJSONProvider(app)
+app.session_interface = ORJSONSessionInterface()
 
 # Initialize database with the app
 db = SQLAlchemy(app)
 
+
+@event.listens_for(Engine, "connect")
+def set_sqlite_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+    """
+    Configure each new SQLite connection for cheap commits.
+
+    WAL mode appends commits to a write-ahead log and, with
+    ``synchronous=NORMAL``, only syncs it at checkpoints instead of on
+    every commit. This stays crash-safe; a power loss can only roll back
+    the most recent transactions.
+
+    Parameters
+    ----------
+    dbapi_connection : Any
+        Raw DBAPI connection that was just opened
+    connection_record : Any
+        SQLAlchemy pool record for the connection (unused)
+    """
+    if isinstance(dbapi_connection, sqlite3.Connection):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+
+
+# Initialize cache and response compression with the app
+cache = Cache(app)
+Compress(app)
+
 # Create models with the database instance
 PetOwner = create_pet_owner_model(db)
 Pet = create_pet_model(db)
 
+# Insert statements built once and reused for every registration
+owner_table = db.metadata.tables["pet_owner"]
+OWNER_INSERT = owner_table.insert().returning(owner_table.c.id)
+PET_INSERT = db.metadata.tables["pet"].insert()
+
+# Cache key for the owner list shown on /view_data
+OWNERS_CACHE_KEY = "flaskpets:owners:all:v1"
+
+# Highest pet number a single owner can register
+MAX_PETS = 5
+
+
+def get_added_pets(mask: int) -> List[int]:
+    """
+    Decode the added-pets bitmask stored in the session.
+
+    Bit ``n`` of the mask is set once pet number ``n`` has been added.
+
+    Parameters
+    ----------
+    mask : int
+        Bitmask of added pet numbers
+
+    Returns
+    -------
+    List[int]
+        Sorted list of pet numbers already added
+    """
+    return [n for n in range(1, MAX_PETS + 1) if mask & (1 << n)]
+
+
+def invalidate_owners_cache() -> None:
+    """
+    Drop the cached owner list shown on /view_data.
+
+    Called after a household has been committed. Cache errors (such as an
+    unreachable Redis server) are logged instead of raised, so they cannot
+    be mistaken for a failed registration; the entry then expires on its
+    own after ``CACHE_DEFAULT_TIMEOUT`` seconds.
+    """
+    try:
+        cache.delete(OWNERS_CACHE_KEY)
+    except Exception:
+        app.logger.exception("Could not invalidate the owner list cache")
+
+
+def render_index(form: PetOwnerForm) -> str:
+    """
+    Render the main form page with the current session progress.
+
+    Parameters
+    ----------
+    form : PetOwnerForm
+        Form instance to render
+
+    Returns
+    -------
+    str
+        Rendered index template
+    """
+    return render_template(
+        "index.html",
+        form=form,
+        added_pets=get_added_pets(session.get("added_pets_mask", 0)),
+        total_pets=session.get("total_pets", 0),
+    )
+
 
 @app.route("/", methods=["GET", "POST"])
 def index() -> Union[str, Any]:
@@ -58,21 +186,27 @@ def index() -> Union[str, Any]:
 
     The form supports multi-pet registration with session management
     to maintain owner information across multiple pet submissions.
+    Pets are kept in the session until the last one is submitted, then
+    the owner and all of their pets are written in a single transaction.
 
     Returns
     -------
     Union[str, Any]
         Rendered template with form or redirect response
     """
-    form = PetOwnerForm()
-
-    # Initialize session data if not exists
-    if "owner_data" not in session:
-        session["owner_data"] = {}
-    if "added_pets" not in session:
-        session["added_pets"] = []
-    if "total_pets" not in session:
-        session["total_pets"] = 0
+    # Initialize session data if not exists (only marks the session
+    # modified when a key is actually added)
+    session.setdefault("owner_data", {})
+    session.setdefault("added_pets_mask", 0)
+    session.setdefault("total_pets", 0)
+    session.setdefault("pending_pets", [])
+
+    # Pre-populate form with session data (submitted values take precedence)
+    form = PetOwnerForm(
+        data={**session["owner_data"], "num_pets": session["total_pets"]}
+        if session["owner_data"]
+        else None
+    )
 
     if form.validate_on_submit():
         try:
@@ -89,101 +223,91 @@ def index() -> Union[str, Any]:
                 }
                 session["total_pets"] = form.num_pets.data
 
+            # Only pet numbers of this household may be used as a mask bit
+            pet_number = (
+                int(current_pet_number) if current_pet_number.isdecimal() else 0
+            )
+            if not 1 <= pet_number <= min(session["total_pets"], MAX_PETS):
+                flash(
+                    f"Invalid pet number {current_pet_number}. Please select one of your pets.",
+                    "error",
+                )
+                return render_index(form)
+            pet_bit = 1 << pet_number
+
+            # Read the pet fields once; the row is queued if it is complete
+            pet_row = form.get_pet_row(pet_number)
+
             # Validate that pet information is provided when a pet is selected
             if (
-                form.pet_type.data
-                and form.sex.data
-                and form.age.data is not None
-                and form.location_type.data is not None
+                pet_row["pet_type"]
+                and pet_row["sex"]
+                and pet_row["age"] is not None
+                and pet_row["location_type"] is not None
             ):
                 # Check if this pet has already been added
-                if int(current_pet_number) in session["added_pets"]:
+                if session["added_pets_mask"] & pet_bit:
                     flash(
                         f"Pet {current_pet_number} has already been added. Please select a different pet.",
                         "error",
                     )
-                    return render_template("index.html", form=form)
-
-                # Create owner (only on first pet)
-                if not session["added_pets"]:
-                    owner = PetOwner(
-                        name=session["owner_data"]["name"],
-                        email=session["owner_data"]["email"],
-                        phone=session["owner_data"]["phone"],
-                        postal_code=session["owner_data"]["postal_code"],
-                    )
-                    db.session.add(owner)
-                    db.session.flush()  # Get the owner ID
-                    session["owner_id"] = owner.id
-                else:
-                    # Get existing owner
-                    owner = PetOwner.query.get(session["owner_id"])
-
-                # Create pet
-                pet = Pet(
-                    pet_type=form.pet_type.data,
-                    sex=form.sex.data,
-                    age=form.age.data,
-                    location_type=form.location_type.data,
-                    microchipped=form.microchipped.data,
-                    pet_number=int(current_pet_number),
-                    owner_id=owner.id,
-                )
-                db.session.add(pet)
-                db.session.commit()
+                    return render_index(form)
+
+                # Queue pet until the whole household has been submitted
+                pending_pets = session["pending_pets"] + [pet_row]
+
+                # Save owner and all pets once the last pet is submitted
+                if len(pending_pets) == session["total_pets"]:
+                    # INSERT ... RETURNING gives the owner ID in one round-trip
+                    owner_id = db.session.execute(
+                        OWNER_INSERT, session["owner_data"]
+                    ).scalar_one()
+
+                    for pet in pending_pets:
+                        pet["owner_id"] = owner_id
+                    db.session.execute(PET_INSERT, pending_pets)
+                    db.session.commit()
+                    invalidate_owners_cache()
 
                 # Add to session tracking
-                session["added_pets"].append(int(current_pet_number))
+                session["pending_pets"] = pending_pets
+                session["added_pets_mask"] |= pet_bit
+                added_count = bin(session["added_pets_mask"]).count("1")
 
                 flash(
-                    f"Pet {current_pet_number} added successfully! ({len(session['added_pets'])} of {session['total_pets']} pets added)",
+                    f"Pet {current_pet_number} added successfully! ({added_count} of {session['total_pets']} pets added)",
                     "success",
                 )
 
                 # Check if all pets have been added
-                if len(session["added_pets"]) == session["total_pets"]:
+                if added_count == session["total_pets"]:
                     flash(
                         "All pets have been added! You can view all data or start a new submission.",
                         "success",
                     )
                     # Clear session data
                     session.pop("owner_data", None)
-                    session.pop("added_pets", None)
+                    session.pop("added_pets_mask", None)
                     session.pop("total_pets", None)
-                    session.pop("owner_id", None)
+                    session.pop("pending_pets", None)
                     return redirect(url_for("index"))
 
-                return render_template("index.html", form=form)
+                return render_index(form)
             else:
                 # Pet information is incomplete
                 flash(
                     "Please complete all pet information fields before submitting.",
                     "error",
                 )
-                return render_template("index.html", form=form)
+                return render_index(form)
 
         except Exception as e:
             db.session.rollback()
-            import traceback
-
-            print(f"Error details: {str(e)}")
-            print(f"Traceback: {traceback.format_exc()}")
+            # The traceback is only formatted if a handler emits the record
+            app.logger.exception("index() failed")
             flash(f"An error occurred: {str(e)}. Please try again.", "error")
 
-    # Pre-populate form with session data
-    if session["owner_data"]:
-        form.name.data = session["owner_data"].get("name", "")
-        form.email.data = session["owner_data"].get("email", "")
-        form.phone.data = session["owner_data"].get("phone", "")
-        form.postal_code.data = session["owner_data"].get("postal_code", "")
-        form.num_pets.data = session["total_pets"]
-
-    return render_template(
-        "index.html",
-        form=form,
-        added_pets=session.get("added_pets", []),
-        total_pets=session.get("total_pets", 0),
-    )
+    return render_index(form)
 
 
 @app.route("/view_data")
@@ -191,47 +315,126 @@ def view_data() -> str:
     """
     Display all submitted pet and owner data.
 
-    Retrieves all PetOwner records from the database and displays
-    them in a table format with their associated pets.
+    Retrieves all PetOwner records with their associated pets and displays
+    them in a table format. The owner list is cached for 60 seconds and
+    invalidated whenever a new owner is saved. Pets are eager-loaded
+    by the relationship, so a cache miss costs two queries. If the cache
+    is unavailable the list is read from the database.
 
     Returns
     -------
     str
         Rendered template showing all submitted data
     """
-    owners = PetOwner.query.all()
+    owners: Optional[List[Dict[str, Any]]]
+    try:
+        owners = cache.get(OWNERS_CACHE_KEY)
+    except Exception:
+        app.logger.exception("Could not read the owner list cache")
+        owners = None
+
+    if owners is None:
+        owners = [
+            {**owner.to_dict(), "pets": [pet.to_dict() for pet in owner.pets]}
+            for owner in PetOwner.query.all()
+        ]
+        try:
+            cache.set(OWNERS_CACHE_KEY, owners)
+        except Exception:
+            app.logger.exception("Could not store the owner list cache")
     return render_template("view_data.html", owners=owners)
 
 
 @app.route("/reset")
-def reset() -> str:
+def reset() -> Any:
     """
     Reset session data to start fresh.
 
     Clears all session data including owner information and
     pet progress tracking. This allows users to start a new
-    submission from scratch.
+    submission from scratch. No flash message is stored, so the
+    emptied session is dropped by deleting the cookie instead of
+    being serialized and signed again.
 
     Returns
     -------
-    str
-        Flash message confirming session reset
+    Any
+        Redirect response to the empty form
     """
     session.clear()
-    flash("Session reset. You can start a new submission.", "success")
     return redirect(url_for("index"))
 
 
+def rebuild_outdated_tables() -> None:
+    """
+    Rebuild tables whose ``created_at`` column predates the server default.
+
+    Rows are inserted without ``created_at`` and rely on the column's
+    ``DEFAULT CURRENT_TIMESTAMP``. Tables created before that default was
+    added would silently store NULL, and SQLite cannot alter a column's
+    default in place. Each such table is recreated from the current model
+    and its rows are copied over; missing timestamps are filled with the
+    current time. Must be called inside an application context.
+    """
+    if db.engine.dialect.name != "sqlite":
+        return
+
+    inspector = inspect(db.engine)
+    for table in db.metadata.sorted_tables:
+        if "created_at" not in table.c or not inspector.has_table(table.name):
+            continue
+        columns = {c["name"]: c for c in inspector.get_columns(table.name)}
+        created_at = columns.get("created_at")
+        if (
+            created_at is not None
+            and created_at["default"] is not None
+            and not created_at["nullable"]
+        ):
+            continue
+
+        # Build the new table next to the old one, then swap the names
+        new_table = table.to_metadata(db.metadata, name=f"{table.name}_rebuild")
+        try:
+            names = [c.name for c in table.c if c.name in columns]
+            source = [
+                (
+                    db.func.coalesce(table.c.created_at, db.func.now())
+                    if name == "created_at"
+                    else table.c[name]
+                )
+                for name in names
+            ]
+            with db.engine.begin() as connection:
+                # Indexes are created afterwards under their usual names
+                connection.execute(CreateTable(new_table))
+                connection.execute(
+                    new_table.insert().from_select(names, db.select(*source))
+                )
+                table.drop(connection)
+                connection.exec_driver_sql(
+                    f'ALTER TABLE "{new_table.name}" RENAME TO "{table.name}"'
+                )
+        finally:
+            db.metadata.remove(new_table)
+        print(f"Rebuilt table {table.name} with the current created_at column")
+
+
 def create_database() -> None:
     """
     Create the database tables.
 
     This function creates all database tables defined in the models.
     It should be called when the application starts to ensure
-    the database schema is properly initialized.
+    the database schema is properly initialized. Tables from older
+    versions of the schema are rebuilt first, and indexes are created
+    separately because ``create_all()`` skips tables that already exist.
     """
     with app.app_context():
+        rebuild_outdated_tables()
         db.create_all()
+        for table in db.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(db.engine, checkfirst=True)
         print("Database tables created successfully!")
 
 
@@ -244,16 +447,17 @@ def get_session_info() -> Dict[str, Any]:
     dict
         Dictionary containing current session state with keys:
         - owner_data: Owner information stored in session
-        - added_pets: List of pet numbers already added
+        - added_pets: List of pet numbers already added (decoded from
+          the ``added_pets_mask`` bitmask)
         - total_pets: Total number of pets to add
-        - owner_id: ID of the current owner
+        - pending_pets: Pets queued for insertion with the owner
         - session_keys: List of all session keys
     """
     return {
         "owner_data": session.get("owner_data", {}),
-        "added_pets": session.get("added_pets", []),
+        "added_pets": get_added_pets(session.get("added_pets_mask", 0)),
         "total_pets": session.get("total_pets", 0),
-        "owner_id": session.get("owner_id"),
+        "pending_pets": session.get("pending_pets", []),
         "session_keys": list(session.keys()),
     }
 
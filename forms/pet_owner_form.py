@@ -27,11 +27,180 @@ Usage:
     form = PetOwnerForm()
 """
 
+import re
+from functools import lru_cache
+
 from flask_wtf import FlaskForm
-from wtforms import StringField, SelectField, IntegerField, BooleanField, SubmitField
-from wtforms.validators import DataRequired, Email, Length, NumberRange, Optional
+from wtforms import (
+    StringField,
+    SelectField,
+    IntegerField,
+    BooleanField,
+    SubmitField,
+    Field,
+)
+from wtforms.validators import (
+    DataRequired,
+    Email,
+    Length,
+    NumberRange,
+    StopValidation,
+    ValidationError,
+)
 from typing import Any, Dict, List, Tuple, Union
 
+# Shape every valid address has; anything else is rejected without parsing
+EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+# Select field choices, shared by every form instance
+NUM_PETS_CHOICES: Tuple[Tuple[int, str], ...] = (
+    (0, "Select number of pets..."),
+    (1, "1"),
+    (2, "2"),
+    (3, "3"),
+    (4, "4"),
+    (5, "5"),
+)
+PET_TYPE_CHOICES: Tuple[Tuple[str, str], ...] = (
+    ("", "Select pet type..."),
+    ("cat", "Cat"),
+    ("dog", "Dog"),
+)
+SEX_CHOICES: Tuple[Tuple[str, str], ...] = (
+    ("", "Select sex..."),
+    ("male", "Male"),
+    ("female", "Female"),
+)
+LOCATION_TYPE_CHOICES: Tuple[Tuple[str, str], ...] = (
+    ("", "Select living area..."),
+    ("city", "City"),
+    ("rural", "Rural"),
+)
+
+
+@lru_cache(maxsize=1024)
+def _is_valid_email(
+    address: str,
+    check_deliverability: bool,
+    allow_smtputf8: bool,
+    allow_empty_local: bool,
+) -> bool:
+    """
+    Check an address with email-validator, caching the verdict.
+
+    Returns
+    -------
+    bool
+        True if email-validator accepts the address, False otherwise
+    """
+    import email_validator
+
+    try:
+        email_validator.validate_email(
+            address,
+            check_deliverability=check_deliverability,
+            allow_smtputf8=allow_smtputf8,
+            allow_empty_local=allow_empty_local,
+        )
+    except email_validator.EmailNotValidError:
+        return False
+    return True
+
+
+class CachedEmail(Email):
+    """
+    Email validator with a precompiled shape check and cached results.
+
+    Addresses that do not match ``EMAIL_RE`` are rejected without calling
+    email-validator. Verdicts for the others are cached, so the owner's
+    address, which is resubmitted with every pet, is only parsed once.
+    Error messages are the same as those of ``Email``.
+    """
+
+    def __call__(self, form: Any, field: Any) -> None:
+        """
+        Validate the email address in the field.
+
+        Parameters
+        ----------
+        form : Any
+            Form the field belongs to
+        field : Any
+            Field holding the email address
+
+        Raises
+        ------
+        ValidationError
+            If the address is not a valid email address
+        """
+        address = field.data
+        if address and EMAIL_RE.match(address):
+            if _is_valid_email(
+                address,
+                self.check_deliverability,
+                self.allow_smtputf8,
+                self.allow_empty_local,
+            ):
+                return
+        elif self.message is not None:
+            raise ValidationError(self.message)
+        # Let Email produce its usual error message
+        super().__call__(form, field)
+
+
+class OptionalFieldMixin(Field):
+    """
+    Field mixin that skips all validation when the input is empty.
+
+    Behaves like an ``Optional`` validator, but the check runs in
+    ``pre_validate``, so empty input stops before the validator chain is
+    entered. Processing errors (such as an unparsable empty integer) are
+    cleared as well. List it before the concrete field class so its
+    ``pre_validate`` runs first.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """
+        Initialize the field and mark it as optional.
+
+        Parameters
+        ----------
+        *args : Any
+            Positional arguments for the concrete field class
+        **kwargs : Any
+            Keyword arguments for the concrete field class
+        """
+        super().__init__(*args, **kwargs)
+        self.flags.optional = True
+
+    def pre_validate(self, form: Any) -> None:
+        """
+        Stop validation for empty input, otherwise defer to the field.
+
+        Parameters
+        ----------
+        form : Any
+            Form the field belongs to
+
+        Raises
+        ------
+        StopValidation
+            If no value or only whitespace was submitted
+        """
+        raw_data = self.raw_data
+        if not raw_data or (isinstance(raw_data[0], str) and not raw_data[0].strip()):
+            self.errors[:] = []
+            raise StopValidation()
+        super().pre_validate(form)
+
+
+class OptionalSelectField(OptionalFieldMixin, SelectField):
+    """Select field that accepts an empty selection without validating it."""
+
+
+class OptionalIntegerField(OptionalFieldMixin, IntegerField):
+    """Integer field that accepts empty input without validating it."""
+
 
 class PetOwnerForm(FlaskForm):
     """
@@ -54,13 +223,13 @@ class PetOwnerForm(FlaskForm):
         Owner's postal code field
     num_pets : SelectField
         Number of pets selection field
-    pet_type : SelectField
+    pet_type : OptionalSelectField
         Pet type selection field (optional)
-    sex : SelectField
+    sex : OptionalSelectField
         Pet sex selection field (optional)
-    age : IntegerField
+    age : OptionalIntegerField
         Pet age input field (optional)
-    location_type : SelectField
+    location_type : OptionalSelectField
         Pet living area selection field (optional)
     microchipped : BooleanField
         Pet microchip status checkbox (optional)
@@ -82,7 +251,7 @@ class PetOwnerForm(FlaskForm):
         "Email",
         validators=[
             DataRequired(message="Email is required"),
-            Email(message="Please enter a valid email address"),
+            CachedEmail(message="Please enter a valid email address"),
         ],
         description="Owner's email address",
     )
@@ -114,14 +283,7 @@ class PetOwnerForm(FlaskForm):
     # Number of pets selection (Required)
     num_pets = SelectField(
         "Number of Pets",
-        choices=[
-            (0, "Select number of pets..."),
-            (1, "1"),
-            (2, "2"),
-            (3, "3"),
-            (4, "4"),
-            (5, "5"),
-        ],
+        choices=NUM_PETS_CHOICES,
         coerce=int,
         default=0,
         validators=[DataRequired(message="Please select the number of pets")],
@@ -129,33 +291,29 @@ class PetOwnerForm(FlaskForm):
     )
 
     # Pet Information Fields (Optional - only validated when adding pets)
-    pet_type = SelectField(
+    pet_type = OptionalSelectField(
         "Pet Type",
-        choices=[("", "Select pet type..."), ("cat", "Cat"), ("dog", "Dog")],
-        validators=[Optional()],
+        choices=PET_TYPE_CHOICES,
         description="Type of pet (cat or dog)",
     )
 
-    sex = SelectField(
+    sex = OptionalSelectField(
         "Sex",
-        choices=[("", "Select sex..."), ("male", "Male"), ("female", "Female")],
-        validators=[Optional()],
+        choices=SEX_CHOICES,
         description="Pet's sex (male or female)",
     )
 
-    age = IntegerField(
+    age = OptionalIntegerField(
         "Age (years)",
         validators=[
-            Optional(),
             NumberRange(min=0, max=30, message="Age must be between 0 and 30 years"),
         ],
         description="Pet's age in years",
     )
 
-    location_type = SelectField(
+    location_type = OptionalSelectField(
         "Living Area",
-        choices=[("", "Select living area..."), ("city", "City"), ("rural", "Rural")],
-        validators=[Optional()],
+        choices=LOCATION_TYPE_CHOICES,
         description="Pet's living environment",
     )
 
@@ -178,28 +336,20 @@ class PetOwnerForm(FlaskForm):
         bool
             True if pet information is valid or not provided, False otherwise
         """
-        # If any pet field is filled, all must be filled
-        pet_fields = [
-            self.pet_type.data,
-            self.sex.data,
-            self.age.data,
-            self.location_type.data,
-        ]
-
-        # Check if any pet field has data
-        has_pet_data = any(
-            field for field in pet_fields if field is not None and field != ""
-        )
+        pet_type = self.pet_type.data
+        sex = self.sex.data
+        age = self.age.data
+        location_type = self.location_type.data
 
-        if has_pet_data:
-            # If any pet field is filled, all must be filled
-            if not all(
-                field for field in pet_fields if field is not None and field != ""
-            ):
-                self.pet_type.errors.append(
-                    "Please complete all pet information fields"
-                )
-                return False
+        # Check if any pet field has data (an age of 0 counts as data)
+        has_pet_data = bool(pet_type or sex or age is not None or location_type)
+
+        # If any pet field is filled, all must be filled
+        if has_pet_data and not (
+            pet_type and sex and age is not None and location_type
+        ):
+            self.pet_type.errors.append("Please complete all pet information fields")
+            return False
 
         return True
 
@@ -246,6 +396,33 @@ class PetOwnerForm(FlaskForm):
             "microchipped": self.microchipped.data,
         }
 
+    def get_pet_row(self, pet_number: int) -> Dict[str, Any]:
+        """
+        Get the submitted pet as a row for a bulk pet insert.
+
+        The row holds the pet table columns except ``owner_id``, which is
+        only known once the owner has been inserted.
+
+        Parameters
+        ----------
+        pet_number : int
+            Sequential number of the pet within the household
+
+        Returns
+        -------
+        dict
+            Dictionary with keys: pet_type, sex, age, location_type,
+            microchipped, pet_number
+        """
+        return {
+            "pet_type": self.pet_type.data,
+            "sex": self.sex.data,
+            "age": self.age.data,
+            "location_type": self.location_type.data,
+            "microchipped": self.microchipped.data,
+            "pet_number": pet_number,
+        }
+
     def has_pet_information(self) -> bool:
         """
         Check if the form contains pet information.
@@ -255,13 +432,12 @@ class PetOwnerForm(FlaskForm):
         bool
             True if any pet field has data, False otherwise
         """
-        pet_fields = [
-            self.pet_type.data,
-            self.sex.data,
-            self.age.data,
-            self.location_type.data,
-        ]
-        return any(field for field in pet_fields if field is not None and field != "")
+        return bool(
+            self.pet_type.data
+            or self.sex.data
+            or self.age.data is not None
+            or self.location_type.data
+        )
 
     def is_complete(self) -> bool:
         """
@@ -272,22 +448,16 @@ class PetOwnerForm(FlaskForm):
         bool
             True if form is complete, False otherwise
         """
-        # Check if owner information is complete
-        owner_fields = [
-            self.name.data,
-            self.email.data,
-            self.phone.data,
-            self.postal_code.data,
-        ]
-        if not all(field for field in owner_fields):
-            return False
-
-        # Check if number of pets is selected
-        if self.num_pets.data == 0:
+        # Check if owner information is complete and a number of pets is
+        # selected (the "Select..." placeholder coerces to 0)
+        if not (
+            self.name.data
+            and self.email.data
+            and self.phone.data
+            and self.postal_code.data
+            and self.num_pets.data
+        ):
             return False
 
         # If pet information is provided, it must be complete
-        if self.has_pet_information():
-            return self.validate_pet_information()
-
-        return True
+        return self.validate_pet_information()
@@ -8,28 +8,46 @@ relationship with the PetOwner model through the owner_id foreign key.
 
 Fields:
 - id: Primary key (auto-incrementing integer)
-- pet_type: Type of pet ('cat' or 'dog', required, max 10 characters)
-- sex: Pet's sex ('male' or 'female', required, max 10 characters)
+- pet_type: Type of pet ('cat' or 'dog', required enum)
+- sex: Pet's sex ('male' or 'female', required enum)
 - age: Pet's age in years (required integer)
-- location_type: Living area ('city' or 'rural', required, max 10 characters)
+- location_type: Living area ('city' or 'rural', required enum)
 - microchipped: Whether the pet is microchipped (boolean, default False)
-- pet_number: Sequential number of the pet for multi-pet households (required integer)
-- owner_id: Foreign key to PetOwner model (required integer)
-- created_at: Timestamp when the record was created (auto-set)
+- pet_number: Sequential number of the pet for multi-pet households (required integer, indexed)
+- owner_id: Foreign key to PetOwner model (required integer, indexed with created_at)
+- created_at: Timestamp when the record was created (set by the database)
 
 Usage:
     from models.pet_model import create_pet_model
     Pet = create_pet_model(db)
 """
 
-from datetime import datetime
-from typing import TYPE_CHECKING, Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, List, Optional
 
 if TYPE_CHECKING:
     from flask_sqlalchemy import SQLAlchemy
     from .pet_owner_model import PetOwner
 
-
+# Display labels for the fixed pet_type and location_type values
+PET_TYPE_TITLES = {"cat": "Cat", "dog": "Dog"}
+LOCATION_TYPE_TITLES = {"city": "City", "rural": "Rural"}
+
+# Columns selected by Pet.to_dicts_for_owner(), in to_dict() key order
+PET_DICT_COLUMNS = (
+    "id",
+    "pet_type",
+    "sex",
+    "age",
+    "location_type",
+    "microchipped",
+    "pet_number",
+    "owner_id",
+    "created_at",
+)
+
+
+@lru_cache(maxsize=None)
 def create_pet_model(db: "SQLAlchemy") -> type:
     """
     Create Pet model with the provided database instance.
@@ -47,7 +65,9 @@ def create_pet_model(db: "SQLAlchemy") -> type:
     Returns
     -------
     type
-        Pet model class with proper database binding
+        Pet model class with proper database binding. Repeated calls with
+        the same database instance return the same class, so the table and
+        mapper are only configured once
 
     Examples
     --------
@@ -89,25 +109,35 @@ def create_pet_model(db: "SQLAlchemy") -> type:
         """
 
         __tablename__ = "pet"
+        __table_args__ = (
+            # Serves owner_id lookups and per-owner chronological listings
+            db.Index("ix_pet_owner_created", "owner_id", "created_at"),
+        )
 
         # Primary key
         id = db.Column(db.Integer, primary_key=True)
 
         # Pet information fields
-        pet_type = db.Column(db.String(10), nullable=False)  # 'cat' or 'dog'
-        sex = db.Column(db.String(10), nullable=False)  # 'male' or 'female'
+        pet_type = db.Column(
+            db.Enum("cat", "dog", name="pet_type_enum"), nullable=False
+        )
+        sex = db.Column(db.Enum("male", "female", name="sex_enum"), nullable=False)
         age = db.Column(db.Integer, nullable=False)
-        location_type = db.Column(db.String(10), nullable=False)  # 'city' or 'rural'
+        location_type = db.Column(
+            db.Enum("city", "rural", name="location_type_enum"), nullable=False
+        )
         microchipped = db.Column(db.Boolean, default=False)
 
         # Sequential number for multi-pet households
-        pet_number = db.Column(db.Integer, nullable=False)
+        pet_number = db.Column(db.Integer, nullable=False, index=True)
 
         # Foreign key to PetOwner
         owner_id = db.Column(db.Integer, db.ForeignKey("pet_owner.id"), nullable=False)
 
         # Timestamp
-        created_at = db.Column(db.DateTime, default=datetime.utcnow)
+        created_at = db.Column(
+            db.DateTime(timezone=True), server_default=db.func.now(), nullable=False
+        )
 
         def __repr__(self) -> str:
             """
@@ -150,6 +180,40 @@ def create_pet_model(db: "SQLAlchemy") -> type:
                 "created_at": self.created_at.isoformat() if self.created_at else None,
             }
 
+        @classmethod
+        def to_dicts_for_owner(cls, owner_id: int) -> List[dict]:
+            """
+            Serialize all pets of one owner without loading Pet objects.
+
+            The columns are fetched as plain rows, so no mapped instances
+            or identity map entries are created for a read-only listing.
+
+            Parameters
+            ----------
+            owner_id : int
+                ID of the owner whose pets are serialized
+
+            Returns
+            -------
+            List[dict]
+                One dictionary per pet, with the same keys as ``to_dict()``,
+                ordered by ID
+            """
+            rows = db.session.execute(
+                db.select(*[getattr(cls, name) for name in PET_DICT_COLUMNS])
+                .where(cls.owner_id == owner_id)
+                .order_by(cls.id)
+            )
+            return [
+                {
+                    **row._asdict(),
+                    "created_at": (
+                        row.created_at.isoformat() if row.created_at else None
+                    ),
+                }
+                for row in rows
+            ]
+
         @property
         def is_adult(self) -> bool:
             """
@@ -200,7 +264,8 @@ def create_pet_model(db: "SQLAlchemy") -> type:
             str
                 Formatted string with pet type and number
             """
-            return f"{self.pet_type.title()} #{self.pet_number}"
+            pet_type = PET_TYPE_TITLES.get(self.pet_type) or self.pet_type.title()
+            return f"{pet_type} #{self.pet_number}"
 
         def is_microchipped(self) -> bool:
             """
@@ -222,6 +287,10 @@ def create_pet_model(db: "SQLAlchemy") -> type:
             str
                 Formatted location string
             """
-            return f"{self.location_type.title()} area"
+            location = (
+                LOCATION_TYPE_TITLES.get(self.location_type)
+                or self.location_type.title()
+            )
+            return f"{location} area"
 
     return Pet
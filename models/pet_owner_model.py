@@ -9,10 +9,10 @@ relationship with the Pet model through the pets relationship.
 Fields:
 - id: Primary key (auto-incrementing integer)
 - name: Owner's full name (required, max 100 characters)
-- email: Owner's email address (required, max 120 characters)
+- email: Owner's email address (required, max 120 characters, indexed)
 - phone: Owner's phone number (required, max 20 characters)
 - postal_code: Owner's postal code (required, max 10 characters)
-- created_at: Timestamp when the record was created (auto-set)
+- created_at: Timestamp when the record was created (set by the database)
 - pets: Relationship to Pet model (one-to-many)
 
 Usage:
@@ -20,7 +20,7 @@ Usage:
     PetOwner = create_pet_owner_model(db)
 """
 
-from datetime import datetime, timezone
+from functools import lru_cache
 from typing import TYPE_CHECKING, List, Optional
 
 if TYPE_CHECKING:
@@ -28,6 +28,7 @@ if TYPE_CHECKING:
     from .pet_model import Pet
 
 
+@lru_cache(maxsize=None)
 def create_pet_owner_model(db: "SQLAlchemy") -> type:
     """
     Create PetOwner model with the provided database instance.
@@ -45,7 +46,9 @@ def create_pet_owner_model(db: "SQLAlchemy") -> type:
     Returns
     -------
     type
-        PetOwner model class with proper database binding
+        PetOwner model class with proper database binding. Repeated calls with
+        the same database instance return the same class, so the table and
+        mapper are only configured once
 
     Examples
     --------
@@ -89,16 +92,18 @@ def create_pet_owner_model(db: "SQLAlchemy") -> type:
 
         # Owner information fields
         name = db.Column(db.String(100), nullable=False)
-        email = db.Column(db.String(120), nullable=False)
+        email = db.Column(db.String(120), nullable=False, index=True)
         phone = db.Column(db.String(20), nullable=False)
         postal_code = db.Column(db.String(10), nullable=False)
 
         # Timestamp
-        created_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
+        created_at = db.Column(
+            db.DateTime(timezone=True), server_default=db.func.now(), nullable=False
+        )
 
-        # Relationship to pets
+        # Relationship to pets (loaded with one extra SELECT ... IN per query)
         pets = db.relationship(
-            "Pet", backref="owner", lazy=True, cascade="all, delete-orphan"
+            "Pet", backref="owner", lazy="selectin", cascade="all, delete-orphan"
         )
 
         def __repr__(self) -> str:
@@ -112,10 +117,15 @@ def create_pet_owner_model(db: "SQLAlchemy") -> type:
             """
             return f"<PetOwner(id={self.id}, name='{self.name}', email='{self.email}')>"
 
-        def to_dict(self) -> dict:
+        def to_dict(self, pets_count: Optional[int] = None) -> dict:
             """
             Convert PetOwner object to dictionary representation.
 
+            Parameters
+            ----------
+            pets_count : int, optional
+                Precomputed number of pets; defaults to ``len(self.pets)``
+
             Returns
             -------
             dict
@@ -135,9 +145,45 @@ def create_pet_owner_model(db: "SQLAlchemy") -> type:
                 "phone": self.phone,
                 "postal_code": self.postal_code,
                 "created_at": self.created_at.isoformat() if self.created_at else None,
-                "pets_count": len(self.pets),
+                "pets_count": len(self.pets) if pets_count is None else pets_count,
             }
 
+        @classmethod
+        def to_dicts_bulk(cls, ids: List[int]) -> List[dict]:
+            """
+            Serialize several owners without loading their pets.
+
+            Pet counts come from a single ``SELECT owner_id, COUNT(*) ...
+            GROUP BY owner_id`` query instead of materializing every Pet row.
+
+            Parameters
+            ----------
+            ids : List[int]
+                IDs of the owners to serialize
+
+            Returns
+            -------
+            List[dict]
+                One ``to_dict()`` dictionary per owner found, ordered by ID
+            """
+            pet_table = db.metadata.tables["pet"]
+            counts = dict(
+                db.session.execute(
+                    db.select(pet_table.c.owner_id, db.func.count())
+                    .where(pet_table.c.owner_id.in_(ids))
+                    .group_by(pet_table.c.owner_id)
+                ).all()
+            )
+            owners = db.session.scalars(
+                db.select(cls)
+                .where(cls.id.in_(ids))
+                .order_by(cls.id)
+                .options(db.lazyload(cls.pets))
+            )
+            return [
+                owner.to_dict(pets_count=counts.get(owner.id, 0)) for owner in owners
+            ]
+
         @property
         def pets_count(self) -> int:
             """
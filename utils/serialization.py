@@ -0,0 +1,177 @@
+"""
+orjson Serialization
+
+This file contains the orjson-backed JSON provider and session interface used by
+the application. orjson encodes directly to UTF-8 bytes, which avoids the
+intermediate ``str`` built by the standard library ``json`` module on every JSON
+response. Session cookies must be text, so the session serializer decodes
+orjson's output to ``str``; it still skips Flask's tagged JSON walk.
+
+Classes:
+- ORJSONProvider: Flask JSON provider used for ``app.json``
+- ORJSONSessionSerializer: Untagged JSON session serializer
+- ORJSONSessionInterface: Signed cookie session interface using the serializer
+
+Usage:
+    from utils.serialization import ORJSONProvider, ORJSONSessionInterface
+    app.json = ORJSONProvider(app)
+    app.session_interface = ORJSONSessionInterface()
+"""
+
+import json
+from typing import Any, Union
+
+import orjson
+from flask import Response
+from flask.json.provider import DefaultJSONProvider, JSONProvider
+from flask.sessions import SecureCookieSessionInterface
+
+
+class ORJSONProvider(JSONProvider):
+    """
+    Flask JSON provider backed by orjson.
+
+    Types orjson does not handle natively (``Decimal``, objects with an
+    ``__html__`` method) fall back to Flask's default conversion.
+    """
+
+    option: int = orjson.OPT_NON_STR_KEYS
+
+    def dumps_bytes(self, obj: Any) -> bytes:
+        """
+        Serialize data as JSON bytes.
+
+        Parameters
+        ----------
+        obj : Any
+            The data to serialize
+
+        Returns
+        -------
+        bytes
+            UTF-8 encoded JSON document
+        """
+        return orjson.dumps(
+            obj, default=DefaultJSONProvider.default, option=self.option
+        )
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """
+        Serialize data as a JSON string.
+
+        Formatting arguments such as ``indent`` or ``separators`` are ignored,
+        orjson always produces compact output.
+
+        Parameters
+        ----------
+        obj : Any
+            The data to serialize
+        **kwargs : Any
+            Arguments accepted by ``json.dumps`` (ignored)
+
+        Returns
+        -------
+        str
+            JSON document
+        """
+        return self.dumps_bytes(obj).decode()
+
+    def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+        """
+        Deserialize data from a JSON string or bytes.
+
+        Hooks such as ``object_hook`` are not supported by orjson, calls that
+        pass them are delegated to the standard library.
+
+        Parameters
+        ----------
+        s : str or bytes
+            Text or UTF-8 bytes
+        **kwargs : Any
+            Arguments accepted by ``json.loads``
+
+        Returns
+        -------
+        Any
+            Deserialized data
+        """
+        if kwargs:
+            return json.loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        """
+        Serialize the given arguments as JSON and return a response.
+
+        The encoded bytes are handed to the response directly, without
+        decoding them to ``str`` first.
+
+        Returns
+        -------
+        Response
+            Response object with the ``application/json`` mimetype
+        """
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            self.dumps_bytes(obj), mimetype="application/json"
+        )
+
+
+class ORJSONSessionSerializer:
+    """
+    Session serializer that encodes and decodes plain JSON with orjson.
+
+    Unlike Flask's ``TaggedJSONSerializer`` the data is not walked in Python
+    to tag non-JSON types, so the session may only hold JSON-compatible
+    values. Tuples (such as flashed messages) come back as lists.
+
+    ``dumps`` returns ``str`` so itsdangerous treats it as a text serializer
+    and produces a ``str`` cookie value, which is what Werkzeug's
+    ``set_cookie`` expects.
+    """
+
+    def dumps(self, value: Any) -> str:
+        """
+        Dump the value to a compact JSON string.
+
+        Parameters
+        ----------
+        value : Any
+            Session data
+
+        Returns
+        -------
+        str
+            JSON document
+        """
+        return orjson.dumps(value).decode()
+
+    def loads(self, value: Union[str, bytes]) -> Any:
+        """
+        Load session data from JSON.
+
+        Parameters
+        ----------
+        value : str or bytes
+            JSON document
+
+        Returns
+        -------
+        Any
+            Session data
+        """
+        return orjson.loads(value)
+
+
+class ORJSONSessionInterface(SecureCookieSessionInterface):
+    """
+    Signed cookie session interface using orjson for serialization.
+
+    A dedicated salt makes cookies written in Flask's tagged format fail
+    verification, so they are replaced by a fresh session instead of being
+    loaded in the wrong shape.
+    """
+
+    salt = "cookie-session-orjson"
+    # itsdangerous only needs dumps() and loads(), not a TaggedJSONSerializer
+    serializer = ORJSONSessionSerializer()  # type: ignore[assignment]